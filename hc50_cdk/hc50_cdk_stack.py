@@ -4,6 +4,7 @@ from aws_cdk import (
     aws_apigateway as _apigateway,
     aws_apigatewayv2 as _apigatewayv2,
     aws_apigatewayv2_integrations as _integrations,
+    aws_ecr_assets as _ecr_assets,
     Stack,
     Duration,
     RemovalPolicy,
@@ -68,14 +69,20 @@ class Hc50CdkStack(Stack):
             id="hc50ModelLambda",
             function_name="hc50-model-lambda",
             code=_lambda.DockerImageCode.from_image_asset(
-                directory="hc50_model_lambda"  # Directory containing Dockerfile and code
+                directory="hc50_model_lambda",  # Directory containing Dockerfile and code
+                platform=_ecr_assets.Platform.LINUX_ARM64,  # Build the image for the ARM 64 runtime
             ),
             environment={
                 "BUCKET_NAME": self.hc50_bucket.bucket_name
             },  # Pass bucket name to Lambda
             architecture=_lambda.Architecture.ARM_64,  # Use ARM 64 architecture
             timeout=Duration.seconds(300),  # Set timeout to 300 seconds
-            memory_size=1024,  # Set memory size to 1024 MB
+            memory_size=1769,  # Set memory size to 1769 MB (one full vCPU)
+        )
+
+        # Publish a version behind an alias and keep one environment initialized
+        self.prediction_lambda_alias = self.prediction_lambda.add_alias(
+            "live", provisioned_concurrent_executions=1
         )
 
         # Grant read permissions on the S3 bucket to the Lambda function
@@ -86,7 +93,7 @@ class Hc50CdkStack(Stack):
             self,
             "hc50ModelApi",
             rest_api_name="hc50-model-api",
-            handler=self.prediction_lambda,
+            handler=self.prediction_lambda_alias,  # Invoke the provisioned alias
             proxy=False,  # Disable proxy integration
         )
 
@@ -119,6 +126,11 @@ class Hc50CdkStack(Stack):
             },  # Pass bucket name to Lambda
         )
 
+        # Publish a version behind an alias and keep one environment initialized
+        self.presigned_lambda_alias = self.presigned_lambda.add_alias(
+            "live", provisioned_concurrent_executions=1
+        )
+
         # Grant write permissions on the S3 bucket to the Lambda function
         self.hc50_bucket.grant_write(self.presigned_lambda)
 
@@ -141,7 +153,7 @@ class Hc50CdkStack(Stack):
 
         # Integrate the Lambda function with the HTTP API
         self.presigned_api_integration = _integrations.HttpLambdaIntegration(
-            "presignedApiIntegration", handler=self.presigned_lambda
+            "presignedApiIntegration", handler=self.presigned_lambda_alias
         )
 
         # Add routes to the HTTP API
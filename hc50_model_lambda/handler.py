@@ -1,4 +1,5 @@
 import json
+from collections import defaultdict
 import torch
 import os
 from torch import nn
@@ -32,6 +33,18 @@ class AutoEncoder(nn.Module):
         return x3, embedding, xpredict
 
 
+# Inference-only subnet: the encoder and prediction head, without the decoder branch
+class AutoEncoderInfer(nn.Module):
+    def __init__(self, autoencoder):
+        super(AutoEncoderInfer, self).__init__()
+        self.l1 = autoencoder.l1
+        self.l2 = autoencoder.l2
+        self.lpredict = autoencoder.lpredict
+
+    def forward(self, x):
+        return self.lpredict(F.relu(self.l2(F.relu(self.l1(x)))))
+
+
 # Load the trained model
 def load_model():
     in_fea = 691
@@ -41,25 +54,60 @@ def load_model():
     drop_rate = 0.5
     model = AutoEncoder(in_fea, h1, latent_size, d_output, drop_rate)
     model.load_state_dict(torch.load("best_model.pt", map_location=torch.device("cpu")))
-    model = model.double()
+    model = AutoEncoderInfer(model)
     model.eval()
+    # Quantize the Linear weights to INT8; activations stay FP32
+    model = torch.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+    # Script and freeze so the weights become constants of the inference graph.
+    # TorchScript is used rather than torch.compile: Inductor needs a C++ toolchain at
+    # runtime, which the Lambda base image does not ship, and cannot trace a ScriptModule.
+    model = torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.script(model)))
     return model
 
 
+# Load the training set normalization statistics exported alongside best_model.pt.
+# Without them the statistics of the uploaded CSV are used instead.
+def load_stats():
+    if not os.path.exists("stats.npz"):
+        return None, None
+    stats = np.load("stats.npz")
+    return stats["mean"].astype(np.float32), stats["std"].astype(np.float32)
+
+
+# Build the model and statistics during the Lambda init phase so warm invocations reuse them
+torch.set_num_threads(1)
+if "qnnpack" in torch.backends.quantized.supported_engines:
+    torch.backends.quantized.engine = "qnnpack"  # ARM64 quantized kernels
+MODEL = load_model()
+MEAN, STD = load_stats()
+
+# Warm up the TorchScript profiling executor before the first request
+with torch.inference_mode():
+    for _ in range(3):
+        MODEL(torch.zeros(1, 691))
+
+
 # Read and process the CSV file from the API Gateway event
 def process_csv(file_content):
-    descriptors_data = pd.read_csv(file_content)
-    descriptors_data_processed = descriptors_data.dropna(axis=1)
-    CAS_values = descriptors_data_processed.iloc[:, 0]
-    HC50 = descriptors_data_processed.iloc[:, 1].to_numpy()
-    descriptors = descriptors_data_processed.iloc[:, 2:].to_numpy()
+    # Parse CAS numbers as strings and everything else straight into float32
+    descriptors_data = pd.read_csv(
+        file_content, engine="c", dtype=defaultdict(lambda: np.float32, {0: str})
+    )
+    CAS_values = descriptors_data.iloc[:, 0]
+    HC50 = descriptors_data.iloc[:, 1].to_numpy()
+    descriptors_data_processed = descriptors_data.iloc[:, 2:].dropna(axis=1, how="any")
+    # Contiguous and writable so normalization below can run in place
+    descriptors = np.require(descriptors_data_processed.to_numpy(copy=False), requirements=["C", "W"])
 
     # Normalize the test data based on the training set statistics
-    mean = np.mean(descriptors, axis=0)
-    std = np.std(descriptors, axis=0)
-    descriptors = (descriptors - mean) / std
-    descriptors[np.isnan(descriptors)] = 0
-    descriptors[np.isinf(descriptors)] = 0
+    if MEAN is not None:
+        mean, std = MEAN, STD
+    else:
+        mean = np.mean(descriptors, axis=0)
+        std = np.std(descriptors, axis=0)
+    np.subtract(descriptors, mean, out=descriptors)
+    np.divide(descriptors, std, out=descriptors)
+    np.nan_to_num(descriptors, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
 
     return descriptors, CAS_values, HC50
 
@@ -69,21 +117,17 @@ def handler(event, context):
     # Decode the base64 encoded file content
     body = event["body"]
     fileName = json.loads(body)["fileName"]
-    path = f"/tmp/${fileName}"
     bucket_name = os.environ["BUCKET_NAME"]
-    s3.download_file(Bucket=bucket_name, Key=fileName, Filename=path)
-
-    model = load_model()
+    # Stream the object straight into pandas instead of going through /tmp
+    obj = s3.get_object(Bucket=bucket_name, Key=fileName)
 
     # Process CSV
-    descriptors, _, _ = process_csv(path)
-
-    # Predictions
-    predictions = []
-    for sample in descriptors:
-        sample_tensor = torch.tensor(sample, dtype=torch.double)
-        _, _, predicted_hc50 = model(sample_tensor)
-        predictions.append(predicted_hc50.item())
+    descriptors, _, _ = process_csv(obj["Body"])
+
+    # Predictions (single batched forward pass over all samples)
+    with torch.inference_mode():
+        predicted_hc50 = MODEL(torch.from_numpy(descriptors))
+    predictions = predicted_hc50.squeeze(-1).tolist()
 
     return {
         "statusCode": 200,
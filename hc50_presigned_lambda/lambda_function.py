@@ -1,13 +1,100 @@
 import json
-import boto3
+import functools
+import hashlib
+import hmac
 import os
 import uuid
+from datetime import datetime, timezone
+from urllib.parse import quote
 
-# Initialize the S3 client
-s3_client = boto3.client("s3")
-
-# Retrieve the bucket name from environment variables
+# Retrieve the bucket name and region from environment variables
 bucket_name = os.environ["BUCKET_NAME"]
+region = os.environ["AWS_REGION"]
+
+
+def sign(key, msg):
+    """
+    Compute an HMAC-SHA256 digest.
+
+    :param key: The signing key as bytes.
+    :param msg: The message to sign as a string.
+    :return: The raw digest bytes.
+    """
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_signing_key(secret_key, date_stamp):
+    """
+    Derive the SigV4 signing key for S3 in this region.
+
+    The key only changes with the credentials or the UTC date, so warm
+    invocations reuse the cached derivation.
+
+    :param secret_key: The AWS secret access key.
+    :param date_stamp: The request date in YYYYMMDD format.
+    :return: The derived signing key bytes.
+    """
+    k_date = sign(("AWS4" + secret_key).encode("utf-8"), date_stamp)
+    k_region = sign(k_date, region)
+    k_service = sign(k_region, "s3")
+    return sign(k_service, "aws4_request")
+
+
+def generate_presigned_put_url(key, content_type, expires_in):
+    """
+    Generate a SigV4 presigned URL for a PUT to S3 without loading boto3.
+
+    Presigning is pure computation over the Lambda's credentials, which the
+    runtime exposes as environment variables, so no botocore client is needed.
+
+    :param key: The object key to upload to.
+    :param content_type: The Content-Type the uploader must send.
+    :param expires_in: The URL expiration time in seconds.
+    :return: The presigned URL.
+    """
+    now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = now.strftime("%Y%m%d")
+    host = f"{bucket_name}.s3.{region}.amazonaws.com"
+    credential_scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+    query = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{os.environ['AWS_ACCESS_KEY_ID']}/{credential_scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_in),
+        "X-Amz-SignedHeaders": "content-type;host",
+    }
+    if "AWS_SESSION_TOKEN" in os.environ:
+        query["X-Amz-Security-Token"] = os.environ["AWS_SESSION_TOKEN"]
+    canonical_query = "&".join(
+        f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in sorted(query.items())
+    )
+    canonical_uri = "/" + quote(key, safe="-_.~/")
+
+    canonical_request = "\n".join(
+        [
+            "PUT",
+            canonical_uri,
+            canonical_query,
+            f"content-type:{content_type}\nhost:{host}\n",
+            "content-type;host",
+            "UNSIGNED-PAYLOAD",
+        ]
+    )
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            credential_scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ]
+    )
+    signing_key = get_signing_key(os.environ["AWS_SECRET_ACCESS_KEY"], date_stamp)
+    signature = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    return f"https://{host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}"
 
 
 def handler(event, context):
@@ -22,11 +109,10 @@ def handler(event, context):
     unique_key = f"{uuid.uuid4()}.csv"
 
     # Generate a presigned URL for uploading the file
-    presigned_url = s3_client.generate_presigned_url(
-        "put_object",
-        Params={"Bucket": bucket_name, "Key": unique_key, "ContentType": "text/csv"},
-        ExpiresIn=300,  # URL expiration time in seconds (5 minutes)
-        HttpMethod="PUT",
+    presigned_url = generate_presigned_put_url(
+        unique_key,
+        content_type="text/csv",
+        expires_in=300,  # URL expiration time in seconds (5 minutes)
     )
 
     # Return the presigned URL and the unique key
@@ -13,3 +13,27 @@ def test_sqs_queue_created():
 #     template.has_resource_properties("AWS::SQS::Queue", {
 #         "VisibilityTimeout": 300
 #     })
+
+
+def test_model_lambda_memory_and_architecture():
+    app = core.App()
+    stack = Hc50CdkStack(app, "hc50-cdk")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "FunctionName": "hc50-model-lambda",
+        "MemorySize": 1769,
+        "Architectures": ["arm64"],
+    })
+
+
+def test_lambdas_have_provisioned_aliases():
+    app = core.App()
+    stack = Hc50CdkStack(app, "hc50-cdk")
+    template = assertions.Template.from_stack(stack)
+
+    template.resource_count_is("AWS::Lambda::Alias", 2)
+    template.all_resources_properties("AWS::Lambda::Alias", {
+        "Name": "live",
+        "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 1},
+    })